@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Enttec DMX USB Pro message parser.
+
+Drop-in replacement for enttec.parse_enttec_frame(), which imports it when it
+has been built. Scans and validates the message in C without boxing every
+byte into a Python int.
+
+Build on the Pi with:
+    pip install cython --break-system-packages
+    cythonize -i _enttec_parse.pyx
+"""
+
+from libc.string cimport memchr
+
+cdef enum:
+    ENTTEC_START_DELIMITER = 0x7E
+    ENTTEC_END_DELIMITER = 0xE7
+    ENTTEC_HEADER_SIZE = 4
+    ENTTEC_MAX_DATA_LENGTH = 600  # See enttec.ENTTEC_MAX_DATA_LENGTH
+
+
+cpdef tuple parse(object buf):
+    """
+    Parse the first Enttec message in a buffer of received bytes.
+
+    Returns:
+        Tuple of (label, data, consumed), see enttec.parse_enttec_frame()
+    """
+    cdef const unsigned char[::1] view = buf
+    cdef Py_ssize_t size = view.shape[0]
+    cdef Py_ssize_t start, length, end
+    cdef const unsigned char *found
+
+    if size == 0:
+        return None, None, 0
+
+    # Find start delimiter with libc's vectorized memchr, everything before it is noise
+    found = <const unsigned char *>memchr(&view[0], ENTTEC_START_DELIMITER, size)
+    if found == NULL:
+        return None, None, size
+    start = found - &view[0]
+
+    if size - start < ENTTEC_HEADER_SIZE:
+        return None, None, start
+
+    length = view[start + 2] | (view[start + 3] << 8)
+
+    # Impossible length - a stray 0x7E, resync on the next one
+    if length > ENTTEC_MAX_DATA_LENGTH:
+        return None, None, start + 1
+
+    end = start + ENTTEC_HEADER_SIZE + length
+    if end >= size:
+        return None, None, start
+
+    # Bad end delimiter - skip this start byte and resync on the next one
+    if view[end] != ENTTEC_END_DELIMITER:
+        return None, None, start + 1
+
+    # View into buf like the Python parser, the caller copies what it needs
+    data = memoryview(buf)[start + ENTTEC_HEADER_SIZE:end]
+    return view[start + 1], data, end + 1
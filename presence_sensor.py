@@ -16,19 +16,34 @@ Hardware:
 
 Dependencies:
 - pip install pyserial python-osc requests --break-system-packages
+- Optional: pip install uvloop --break-system-packages
 
 Author: Copenhagen Light Festival Installation
 """
 
+import array
+import asyncio
+import fcntl
+import os
 import time
 import socket
 import logging
 import serial
+import termios
 from typing import Optional
 
 import requests
+from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.udp_client import SimpleUDPClient
 
+from enttec import ENTTEC_LABEL_DMX_RECEIVED, parse_enttec_frame
+
+try:
+    # Optional faster event loop (pip install uvloop --break-system-packages)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # ----- Configuration -----
 # Serial port for Enttec DMX USB Pro
 # 
@@ -45,12 +60,22 @@ from pythonosc.udp_client import SimpleUDPClient
 # The Enttec will show as "FT232R USB UART" or similar FTDI device
 DMX_SERIAL_PORT = "/dev/ttyUSB0"
 
+# serial_struct flag telling the FTDI driver to hand received bytes over
+# immediately instead of after its default 16ms latency timer
+ASYNC_LOW_LATENCY = 0x2000
+
 # OSC Configuration - RNBO runner listens on port 1234
 OSC_PORT = 1234
 
 # OSCQuery HTTP port for discovering RNBO parameters
 OSCQUERY_PORT = 5678
 
+# QoS marking for OSC packets, so switches and the local qdisc prioritize the
+# crossfade triggers over background traffic
+OSC_IP_TOS = 0xB8  # DSCP EF (expedited forwarding)
+OSC_SO_PRIORITY = 6  # Highest priority allowed without CAP_NET_ADMIN
+OSC_SNDBUF = 65536
+
 # RNBO parameter path for fade trigger
 # fadeTrig: 0 = dystopian (no presence), 1 = utopian (presence detected)
 PRESENCE_PARAM_PATH = "/rnbo/inst/0/params/fadeTrig"
@@ -58,13 +83,23 @@ PRESENCE_PARAM_PATH = "/rnbo/inst/0/params/fadeTrig"
 # DMX channel to read for presence (1-indexed as per DMX convention)
 DMX_PRESENCE_CHANNEL = 20
 
-# Polling interval in seconds
-POLL_INTERVAL = 0.05  # 50ms - fast enough to catch DMX updates
+# Resend the current state after this many seconds without an OSC send, in case
+# a packet was lost (OSC is otherwise only sent when the presence state changes)
+KEEPALIVE_INTERVAL = 2.0
+
+# CPU core the bridge runs on (Pi 5 has cores 0-3). This only restricts where
+# the bridge is scheduled; other threads still share the core unless it is
+# isolated with isolcpus=3, see SYSTEMD_SERVICE.md
+BRIDGE_CPU_CORE = 3
+
+# SCHED_FIFO priority for the bridge (1-99). Preempts all normally scheduled
+# processes but deliberately stays below JACK/RNBO's real-time audio threads
+# (~70+), so audio always wins. Needs CAP_SYS_NICE, see SYSTEMD_SERVICE.md -
+# falls back to normal scheduling without it
+BRIDGE_RT_PRIORITY = 10
 
-# ----- Enttec DMX USB Pro Protocol Constants -----
-ENTTEC_START_DELIMITER = 0x7E
-ENTTEC_END_DELIMITER = 0xE7
-ENTTEC_LABEL_DMX_RECEIVED = 5
+# Returned by EnttecDMXReceiver.read_channel_fast() when the channel did not change
+UNCHANGED = object()
 
 # ----- Logging Setup -----
 logging.basicConfig(
@@ -85,30 +120,47 @@ class RNBOConnection:
         self.osc_client: Optional[SimpleUDPClient] = None
         self.ip_address: Optional[str] = None
         self.oscquery_url: Optional[str] = None
+        self._http = requests.Session()  # Reuses the OSCQuery TCP connection
+        self._resolved_host: Optional[str] = None  # Kept across discover() retries
+        self._tree_cache: Optional[dict] = None  # OSCQuery tree from discover()
+        self._path_index: Optional[dict] = None  # FULL_PATH -> value, built from the tree
+        self._sock: Optional[socket.socket] = None  # UDP socket of osc_client
+        self._dgrams: dict = {}  # (path, value) -> serialized OSC message
         
     def discover(self) -> bool:
         """
         Discover RNBO runner via OSCQuery. Resolves hostname and verifies connection.
         Returns True if successful, False otherwise.
         """
-        # Resolve hostname to IP address
-        hostname = socket.gethostname() + ".local"
-        try:
-            self.ip_address = socket.gethostbyname(hostname)
-            logger.info(f"Resolved hostname '{hostname}' to IP: {self.ip_address}")
-        except socket.gaierror:
-            # Fallback to localhost
-            self.ip_address = "127.0.0.1"
-            logger.warning("Could not resolve hostname, using localhost")
+        # Resolve hostname to IP address (mDNS is slow, so only once)
+        if self._resolved_host is None:
+            hostname = socket.gethostname() + ".local"
+            try:
+                self._resolved_host = socket.gethostbyname(hostname)
+                logger.info(f"Resolved hostname '{hostname}' to IP: {self._resolved_host}")
+            except socket.gaierror:
+                logger.warning("Could not resolve hostname, using localhost")
+        # Fallback to localhost
+        self.ip_address = self._resolved_host or "127.0.0.1"
             
         self.oscquery_url = f"http://{self.ip_address}:{self.oscquery_port}"
         
         # Verify OSCQuery is responding
         try:
-            response = requests.get(self.oscquery_url, timeout=2)
+            response = self._http.get(self.oscquery_url, timeout=2)
             if response.status_code == 200:
                 logger.info(f"OSCQuery server found at {self.oscquery_url}")
+                # The response is the full tree, keep it for fetch_tree()
+                try:
+                    self._tree_cache = response.json()
+                except ValueError:
+                    self._tree_cache = None
+                self._path_index = None
                 self.osc_client = SimpleUDPClient(self.ip_address, self.osc_port)
+                # Destination never changes, so connect once and use send()
+                self._sock = self.osc_client._sock
+                self._set_socket_priority()
+                self._sock.connect((self.ip_address, self.osc_port))
                 return True
             else:
                 logger.error(f"OSCQuery returned status {response.status_code}")
@@ -117,14 +169,30 @@ class RNBOConnection:
             logger.error(f"Could not connect to OSCQuery: {e}")
             return False
             
+    def _set_socket_priority(self):
+        """Mark OSC packets as low-latency traffic. Not fatal if the OS refuses an option."""
+        options = [
+            (socket.IPPROTO_IP, socket.IP_TOS, OSC_IP_TOS, "IP_TOS"),
+            (socket.SOL_SOCKET, socket.SO_PRIORITY, OSC_SO_PRIORITY, "SO_PRIORITY"),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, OSC_SNDBUF, "SO_SNDBUF"),
+        ]
+        for level, option, value, name in options:
+            try:
+                self._sock.setsockopt(level, option, value)
+            except OSError as e:
+                logger.warning(f"Could not set {name} on OSC socket: {e}")
+            
     def fetch_tree(self) -> Optional[dict]:
-        """Fetch full OSCQuery tree to inspect available parameters."""
+        """Fetch full OSCQuery tree to inspect available parameters (cached after the first GET)."""
+        if self._tree_cache is not None:
+            return self._tree_cache
         if not self.oscquery_url:
             return None
         try:
-            response = requests.get(self.oscquery_url, timeout=2)
+            response = self._http.get(self.oscquery_url, timeout=2)
             if response.status_code == 200:
-                return response.json()
+                self._tree_cache = response.json()
+                return self._tree_cache
         except Exception as e:
             logger.error(f"Error fetching OSCQuery tree: {e}")
         return None
@@ -134,28 +202,34 @@ class RNBOConnection:
         Search OSCQuery tree for any of the given parameter paths.
         Returns the first found path or None.
         """
-        tree = self.fetch_tree()
-        if not tree:
-            return None
+        if self._path_index is None:
+            tree = self.fetch_tree()
+            if not tree:
+                return None
+            self._path_index = self._index_tree(tree)
             
         for path in search_paths:
-            if self._search_tree(tree, path) is not None:
+            if path in self._path_index:
                 logger.info(f"Found parameter path: {path}")
                 return path
         return None
         
-    def _search_tree(self, tree: dict, target_path: str):
-        """Recursively search OSCQuery tree for a specific path."""
-        if not isinstance(tree, dict):
-            return None
-        if tree.get("FULL_PATH") == target_path:
-            val = tree.get("value") or tree.get("VALUE")
-            return val[0] if isinstance(val, list) and val else val
-        for child in (tree.get("CONTENTS") or {}).values():
-            result = self._search_tree(child, target_path)
-            if result is not None:
-                return result
-        return None
+    def _index_tree(self, tree: dict) -> dict:
+        """Walk OSCQuery tree once and map every FULL_PATH that has a value to it."""
+        paths = {}
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            full_path = node.get("FULL_PATH")
+            if full_path and full_path not in paths:
+                val = node.get("value") or node.get("VALUE")
+                val = val[0] if isinstance(val, list) and val else val
+                if val is not None:
+                    paths[full_path] = val
+            stack.extend((node.get("CONTENTS") or {}).values())
+        return paths
         
     def send_presence(self, value: int, path: str = PRESENCE_PARAM_PATH):
         """
@@ -166,14 +240,34 @@ class RNBOConnection:
             path: OSC address path for the fadeTrig parameter
         """
         if self.osc_client:
-            self.osc_client.send_message(path, value)
-            logger.debug(f"Sent OSC: {path} = {value}")
+            # Only a couple of distinct messages are ever sent, so build each one once
+            dgram = self._dgrams.get((path, value))
+            if dgram is None:
+                builder = OscMessageBuilder(address=path)
+                builder.add_arg(value, OscMessageBuilder.ARG_TYPE_INT)
+                dgram = self._dgrams[(path, value)] = builder.build().dgram
+            try:
+                self._sock.send(dgram)
+            except OSError as e:
+                # A connected UDP socket reports ICMP errors, e.g. RNBO not listening yet
+                logger.warning("Could not send OSC: %s", e)
+                return
+            logger.debug("Sent OSC: %s = %s", path, value)
+            
+    def close(self):
+        """Close OSCQuery HTTP session."""
+        self._http.close()
 
 
-class EnttecDMXReceiver:
+class EnttecDMXReceiver(asyncio.Protocol):
     """
     Receives DMX data from Enttec DMX USB Pro.
     
+    Runs as an asyncio protocol on the serial port: the event loop wakes it
+    up when bytes arrive, complete messages are parsed in data_received()
+    and the latest universe is kept in dmx_data for read_channel_fast()
+    and get_presence().
+    
     Protocol based on Enttec DMX USB Pro API v1.44:
     - Message format: [0x7E][Label][LengthLSB][LengthMSB][Data...][0xE7]
     - Label 5 = Received DMX Packet
@@ -185,114 +279,152 @@ class EnttecDMXReceiver:
     def __init__(self, port: str = DMX_SERIAL_PORT):
         self.port = port
         self.serial: Optional[serial.Serial] = None
-        self.dmx_data = [0] * 513  # Start code + 512 channels
+        self.transport: Optional[asyncio.ReadTransport] = None
+        self.dmx_data = bytearray(513)  # Last received start code + 512 channels
+        self._last_ch: dict = {}  # channel -> last value returned by read_channel_fast()
+        self._buf = bytearray()  # Received bytes not yet parsed into messages
+        self._slots = 0  # Number of slots of the latest universe in dmx_data
+        self._new_data = asyncio.Event()  # Set when dmx_data was updated or the connection lost
+        self._lost = False
         
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """
         Open serial connection to Enttec DMX USB Pro.
         Returns True if successful.
         """
         try:
             # Enttec uses virtual COM port - baudrate is ignored but required
-            self.serial = serial.Serial(
+            # Opening can take a while, so in a worker thread to overlap with RNBO discovery
+            self.serial = await asyncio.to_thread(
+                serial.Serial,
                 port=self.port,
-                baudrate=57600,  # Dummy value, USB handles actual speed
-                timeout=1.0
+                baudrate=57600  # Dummy value, USB handles actual speed
             )
-            logger.info(f"Connected to Enttec DMX USB Pro on {self.port}")
-            return True
         except serial.SerialException as e:
             logger.error(f"Failed to connect to Enttec: {e}")
             return False
-    
-    def _read_message(self) -> Optional[tuple]:
-        """
-        Read and parse one Enttec message from serial.
-        
-        Returns:
-            Tuple of (label, data) if valid message, None otherwise
-        """
-        if not self.serial:
-            return None
             
-        # Find start delimiter
+        # pyserial only configures the port. The event loop reads the fd with
+        # os.read() when it is readable, bypassing serial.read(), and closes
+        # the port together with the transport.
+        self.transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+            lambda: self, self.serial
+        )
+        logger.info(f"Connected to Enttec DMX USB Pro on {self.port}")
+        self._enable_low_latency()
+        return True
+            
+    def _enable_low_latency(self):
+        """Set ASYNC_LOW_LATENCY on the serial port, so DMX frames are not held back by the driver."""
+        ser = self.serial
+        try:
+            if hasattr(ser, "set_low_latency_mode"):  # pyserial >= 3.5
+                ser.set_low_latency_mode(True)
+            else:
+                # Same as pyserial: flags is the 5th int of struct serial_struct
+                serial_struct = array.array('i', [0] * 32)
+                fcntl.ioctl(ser.fileno(), termios.TIOCGSERIAL, serial_struct)
+                serial_struct[4] |= ASYNC_LOW_LATENCY
+                fcntl.ioctl(ser.fileno(), termios.TIOCSSERIAL, serial_struct)
+            logger.info("Enabled low latency mode on serial port")
+        except (OSError, ValueError) as e:
+            # Not fatal - only adds up to 16ms latency per frame
+            logger.warning(f"Could not enable low latency mode: {e}")
+            
+    def data_received(self, data: bytes):
+        """Buffer received bytes and handle every complete Enttec message."""
+        self._buf += data
         while True:
-            byte = self.serial.read(1)
-            if not byte:
-                return None  # Timeout
-            if byte[0] == ENTTEC_START_DELIMITER:
-                break
-        
-        # Read label and length
-        header = self.serial.read(3)
-        if len(header) < 3:
-            return None
+            label, message_data, consumed = parse_enttec_frame(self._buf)
+            if not consumed:
+                break  # Wait for the rest of the message
+            if label is not None:
+                self._handle_message(label, message_data)
+            # message_data is a view into the buffer, release it before trimming
+            message_data = None
+            del self._buf[:consumed]
             
-        label = header[0]
-        length = header[1] | (header[2] << 8)
-        
-        # Read data
-        data = self.serial.read(length) if length > 0 else b''
-        if len(data) < length:
-            return None
+    def _handle_message(self, label: int, data: memoryview):
+        """Cache a received DMX universe in dmx_data and signal waiting readers."""
+        # Only process DMX received packets (label 5)
+        if label != ENTTEC_LABEL_DMX_RECEIVED:
+            return
             
-        # Read end delimiter
-        end = self.serial.read(1)
-        if not end or end[0] != ENTTEC_END_DELIMITER:
-            logger.warning("Invalid end delimiter")
-            return None
+        # First byte is status (0 = valid)
+        if len(data) < 2 or data[0] != 0:
+            return
             
-        return (label, data)
+        # Data format: [status][start_code][ch1][ch2]...[ch512]
+        # Cache the universe without the status byte, so channel N is at index N
+        slots = min(len(data) - 1, len(self.dmx_data))
+        self.dmx_data[:slots] = data[1:slots + 1]
+        self._slots = slots
+        self._new_data.set()
+                
+    def connection_lost(self, exc: Optional[Exception]):
+        if exc:
+            logger.error(f"Enttec connection lost: {exc}")
+        self.transport = None
+        self._lost = True
+        self._new_data.set()
     
-    def read_dmx_channel(self, channel: int) -> Optional[int]:
+    async def _read_universe(self) -> int:
         """
-        Read a specific DMX channel value.
+        Wait until a DMX universe was received since the last call. Only call after connect().
+        
+        Latest wins: if several universes arrived in the meantime, dmx_data
+        holds the newest one and the older ones are skipped.
+        
+        Returns:
+            Number of slots (start code + channels) of the latest universe in dmx_data
+        """
+        await self._new_data.wait()
+        self._new_data.clear()
+        if self._lost:
+            raise serial.SerialException(f"Enttec connection on {self.port} lost")
+        return self._slots
+    
+    async def read_channel_fast(self, channel: int):
+        """
+        Read a specific DMX channel value from the latest received universe, if it changed.
+        
+        Lets callers skip all further work on frames where a rarely changing
+        channel stayed the same.
         
         Args:
             channel: DMX channel number (1-512)
             
         Returns:
-            Channel value (0-255) or None if no valid data
+            Channel value (0-255) if it changed since the last read, UNCHANGED
+            if not, or None if no valid data
         """
-        message = self._read_message()
-        if not message:
+        slots = await self._read_universe()
+        if channel >= slots:
             return None
             
-        label, data = message
-        
-        # Only process DMX received packets (label 5)
-        if label != ENTTEC_LABEL_DMX_RECEIVED:
-            return None
-            
-        # First byte is status (0 = valid)
-        if len(data) < 2 or data[0] != 0:
-            return None
-            
-        # Data format: [status][start_code][ch1][ch2]...[ch512]
-        # Channel 1 is at index 2 (after status and start code)
-        dmx_index = channel + 1  # +1 for start code (status already at index 0)
-        
-        if dmx_index >= len(data):
-            return None
-            
-        return data[dmx_index]
+        value = self.dmx_data[channel]
+        if value == self._last_ch.get(channel):
+            return UNCHANGED
+        self._last_ch[channel] = value
+        return value
     
-    def get_presence(self) -> Optional[bool]:
+    async def get_presence(self) -> Optional[bool]:
         """
         Read presence state from DMX channel.
         
         Returns:
-            True if presence detected (DMX > 0), False if absent, None if no data
+            True if presence detected (DMX > 0), False if absent, None if no
+            data or the channel did not change
         """
-        value = self.read_dmx_channel(DMX_PRESENCE_CHANNEL)
-        if value is None:
+        value = await self.read_channel_fast(DMX_PRESENCE_CHANNEL)
+        if value is None or value is UNCHANGED:
             return None
         return value > 0
     
     def close(self):
         """Close serial connection."""
-        if self.serial:
-            self.serial.close()
+        if self.transport:
+            self.transport.close()
             logger.info("Enttec connection closed")
 
 
@@ -307,26 +439,42 @@ class DMXToOSCBridge:
         self.running = False
         self.current_presence = False
         self.param_path = PRESENCE_PARAM_PATH
+        self._last_sent = 0.0  # time.monotonic() of the last OSC send
         
-    def setup(self) -> bool:
+    async def setup(self) -> bool:
         """
         Initialize all components.
+        RNBO discovery and the Enttec connection are independent, so they run concurrently.
         Returns True if setup successful.
         """
-        # Discover RNBO
+        rnbo_ok, dmx_ok = await asyncio.gather(self._setup_rnbo(), self._setup_dmx())
+        if not (rnbo_ok and dmx_ok):
+            self.dmx.close()
+            return False
+            
+        logger.info("Setup complete!")
+        return True
+        
+    async def _setup_rnbo(self) -> bool:
+        """Discover RNBO runner and its fadeTrig parameter. Returns True if found."""
+        # Discover RNBO (blocking DNS/HTTP, so in a worker thread)
         logger.info("Searching for RNBO runner...")
-        max_retries = 30
+        # Retry with exponential backoff capped at 1s: an RNBO runner that is
+        # already up is found right away, a booting one still gets ~30s
+        max_wait = 30.0
+        max_delay = 1.0
+        delay = 0.05
         retry_count = 0
+        deadline = time.monotonic() + max_wait
         
-        while retry_count < max_retries:
-            if self.rnbo.discover():
-                break
+        while not await asyncio.to_thread(self.rnbo.discover):
+            if time.monotonic() >= deadline:
+                logger.error(f"Could not find RNBO runner within {max_wait:.0f}s")
+                return False
             retry_count += 1
-            logger.info(f"Retry {retry_count}/{max_retries}...")
-            time.sleep(1)
-        else:
-            logger.error("Could not find RNBO runner after max retries")
-            return False
+            logger.info(f"Retry {retry_count} in {delay:.2f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
             
         # Try to find the fadeTrig parameter in RNBO
         possible_paths = [
@@ -334,71 +482,109 @@ class DMXToOSCBridge:
             "/rnbo/inst/1/params/fadeTrig",
         ]
         
-        found_path = self.rnbo.find_parameter_path(possible_paths)
+        found_path = await asyncio.to_thread(self.rnbo.find_parameter_path, possible_paths)
         if found_path:
             self.param_path = found_path
         else:
             logger.warning(f"Parameter not found in OSCQuery, using default: {self.param_path}")
-            
-        # Connect to Enttec DMX USB Pro
+        return True
+        
+    async def _setup_dmx(self) -> bool:
+        """Connect to Enttec DMX USB Pro. Returns True if connected."""
         logger.info("Connecting to Enttec DMX USB Pro...")
-        if not self.dmx.connect():
+        if not await self.dmx.connect():
             logger.error("Could not connect to Enttec DMX USB Pro")
             return False
-            
-        logger.info("Setup complete!")
         return True
         
-    def run(self):
+    async def run(self):
         """
-        Main loop - reads DMX and sends OSC messages.
+        Main loop - waits for DMX and sends OSC messages on presence changes.
         """
         self.running = True
         logger.info(f"Starting main loop, reading DMX ch{DMX_PRESENCE_CHANNEL}, sending to {self.param_path}")
         
+        keepalive = asyncio.create_task(self._keepalive())
         try:
             while self.running:
-                # Read presence from DMX
-                presence = self.dmx.get_presence()
+                # Wait for the next DMX frame
+                presence = await self.dmx.get_presence()
                 
                 if presence is not None and presence != self.current_presence:
                     self.current_presence = presence
                     state_str = "PRESENT (utopian)" if presence else "ABSENT (dystopian)"
                     logger.info(f"Presence changed: {state_str}")
-                
-                # Send current state to RNBO (send every cycle to ensure sync)
-                fade_value = 1 if self.current_presence else 0
-                self.rnbo.send_presence(fade_value, self.param_path)
-                
-                time.sleep(POLL_INTERVAL)
-                
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user")
+                    self._send_state()
+                    
         finally:
+            keepalive.cancel()
             self.shutdown()
             
+    async def _keepalive(self):
+        """Resend the current state once nothing was sent for KEEPALIVE_INTERVAL, to ensure sync."""
+        while True:
+            idle = time.monotonic() - self._last_sent
+            if idle >= KEEPALIVE_INTERVAL:
+                self._send_state()
+                idle = 0.0
+            await asyncio.sleep(KEEPALIVE_INTERVAL - idle)
+            
+    def _send_state(self):
+        """Send current presence state to RNBO."""
+        fade_value = 1 if self.current_presence else 0
+        self.rnbo.send_presence(fade_value, self.param_path)
+        self._last_sent = time.monotonic()
+            
     def shutdown(self):
         """Clean shutdown of all components."""
         self.running = False
         self.dmx.close()
+        self.rnbo.close()
         logger.info("Shutdown complete")
 
 
+def set_scheduling():
+    """Pin the process to BRIDGE_CPU_CORE and request real-time scheduling to reduce latency jitter."""
+    try:
+        os.sched_setaffinity(0, {BRIDGE_CPU_CORE})
+        logger.info(f"Pinned to CPU core {BRIDGE_CPU_CORE}")
+    except OSError as e:
+        logger.warning(f"Could not pin to CPU core {BRIDGE_CPU_CORE}: {e}")
+        
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(BRIDGE_RT_PRIORITY))
+        logger.info(f"Using SCHED_FIFO priority {BRIDGE_RT_PRIORITY}")
+    except PermissionError:
+        logger.warning("No permission for SCHED_FIFO (needs CAP_SYS_NICE), using normal scheduling")
+
+
+async def run_bridge(bridge: DMXToOSCBridge) -> int:
+    """Set up the bridge and run it until stopped. Returns the exit code."""
+    if not await bridge.setup():
+        logger.error("Setup failed, exiting")
+        return 1
+        
+    await bridge.run()
+    return 0
+
+
 def main():
     """Entry point for the DMX to OSC bridge."""
     logger.info("=" * 50)
     logger.info("Copenhagen Light Festival - DMX to OSC Bridge")
     logger.info("=" * 50)
     
+    set_scheduling()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
     bridge = DMXToOSCBridge()
     
-    if bridge.setup():
-        bridge.run()
-    else:
-        logger.error("Setup failed, exiting")
-        return 1
-        
-    return 0
+    try:
+        return asyncio.run(run_bridge(bridge))
+    except KeyboardInterrupt:
+        logger.info("Interrupted by user")
+        return 0
 
 
 if __name__ == "__main__":
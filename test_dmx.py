@@ -20,16 +20,17 @@ Dependencies:
 import serial
 import sys
 
+from enttec import (
+    ENTTEC_LABEL_DMX_RECEIVED,
+    enttec_bytes_needed,
+    parse_enttec_frame,
+)
+
 # ----- Configuration -----
 # Change this if your Enttec is on a different port
 DMX_SERIAL_PORT = "/dev/ttyUSB0"
 DMX_CHANNEL_TO_READ = 1
 
-# Enttec protocol constants
-ENTTEC_START_DELIMITER = 0x7E
-ENTTEC_END_DELIMITER = 0xE7
-ENTTEC_LABEL_DMX_RECEIVED = 5
-
 
 def find_enttec_port():
     """List available serial ports to help find Enttec."""
@@ -52,40 +53,33 @@ def find_enttec_port():
     return ports
 
 
-def read_dmx_message(ser):
+def read_dmx_message(ser, buf):
     """
     Read one DMX message from Enttec.
     
+    Args:
+        ser: Open serial port
+        buf: bytearray holding received bytes not yet parsed, kept between calls
+    
     Returns:
         Tuple of (label, data) if valid, None otherwise
     """
-    # Find start delimiter
     while True:
-        byte = ser.read(1)
-        if not byte:
+        label, data, consumed = parse_enttec_frame(buf)
+        if label is not None:
+            # data is a view into buf, copy it before trimming the buffer
+            data = bytes(data)
+        if consumed:
+            del buf[:consumed]
+        if label is not None:
+            return (label, data)
+        if consumed:
+            continue  # Dropped noise or a corrupt message, parse the rest
+        
+        chunk = ser.read(max(enttec_bytes_needed(buf), ser.in_waiting))
+        if not chunk:
             return None  # Timeout
-        if byte[0] == ENTTEC_START_DELIMITER:
-            break
-    
-    # Read label and length
-    header = ser.read(3)
-    if len(header) < 3:
-        return None
-    
-    label = header[0]
-    length = header[1] | (header[2] << 8)
-    
-    # Read data
-    data = ser.read(length) if length > 0 else b''
-    if len(data) < length:
-        return None
-    
-    # Read end delimiter
-    end = ser.read(1)
-    if not end or end[0] != ENTTEC_END_DELIMITER:
-        return None
-    
-    return (label, data)
+        buf += chunk
 
 
 def main():
@@ -124,10 +118,11 @@ def main():
     
     last_value = None
     message_count = 0
+    buf = bytearray()
     
     try:
         while True:
-            message = read_dmx_message(ser)
+            message = read_dmx_message(ser, buf)
             
             if message is None:
                 continue